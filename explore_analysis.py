@@ -80,19 +80,32 @@ def create_scenario_data(scenario, num_keystrokes):
     # Text to type (realistic programming/writing content)
     sample_text = "def analyze_typing_patterns(data): return statistical_analysis(data)"
     
+    # Scenario parameters resolved once; uniform(a, b) is inlined as
+    # a + (b - a) * rand() in the loop
+    rand = random.random
+    choice = random.choice
+    apps = scenario["apps"]
+    wpm_lo, wpm_hi = scenario["wpm_range"]
+    wpm_span = wpm_hi - wpm_lo
+    cl_lo, cl_hi = scenario["cognitive_load"]
+    cl_span = cl_hi - cl_lo
+    pause_factor = scenario["pause_factor"]
+    correction_rate = scenario["correction_rate"]
+    session_id = f"scenario-{scenario['desc'][:10]}"
+    
     for i in range(num_keystrokes):
         # Pick app context
-        app_name, window_title = random.choice(scenario["apps"])
+        app_name, window_title = choice(apps)
         
         # Get character
         char = sample_text[i % len(sample_text)]
         
         # Scenario-specific timing
-        base_interval = 60.0 / random.uniform(*scenario["wpm_range"]) / 5  # 5 chars per word
-        time_delta = base_interval * scenario["pause_factor"] * random.uniform(0.5, 1.5)
+        base_interval = 60.0 / (wpm_lo + wpm_span * rand()) / 5  # 5 chars per word
+        time_delta = base_interval * pause_factor * (0.5 + rand())
         
         # Add corrections
-        is_correction = random.random() < scenario["correction_rate"]
+        is_correction = rand() < correction_rate
         if is_correction:
             char = ""
             key_name = "backspace"
@@ -108,16 +121,16 @@ def create_scenario_data(scenario, num_keystrokes):
             key_code=hash(char or key_name),
             key_char=char,
             key_name=key_name,
-            dwell_time=random.uniform(0.06, 0.12),
+            dwell_time=0.06 + 0.06 * rand(),
             time_since_last=time_delta,
             app_name=app_name,
             window_title=window_title,
-            session_id=f"scenario-{scenario['desc'][:10]}",
+            session_id=session_id,
             is_correction=is_correction,
             pause_before=time_delta if time_delta > 0.1 else 0.0,
             typing_burst=time_delta < 0.15,
             finger_assignment='right_index',  # Simplified
-            cognitive_load_indicator=random.uniform(*scenario["cognitive_load"])
+            cognitive_load_indicator=cl_lo + cl_span * rand()
         )
         
         events.append(event)
@@ -12,15 +12,32 @@ __description__ = (
     "Advanced macOS typing pattern analyzer with comprehensive behavioral insights"
 )
 
-from .keylogger import TypingAnalyzerKeylogger, MacOSAppTracker
-from .analyzer import TypingPatternAnalyzer
-from .utils import KeystrokeEvent, ConfigManager, DataManager
-
-__all__ = [
-    "TypingAnalyzerKeylogger",
-    "MacOSAppTracker",
-    "TypingPatternAnalyzer",
-    "KeystrokeEvent",
-    "ConfigManager",
-    "DataManager",
-]
+import importlib
+from typing import Any
+
+# Public names are imported from their submodule on first access, so that
+# importing e.g. src.utils does not also load the keylogger and analyzer
+_EXPORTS = {
+    "TypingAnalyzerKeylogger": "keylogger",
+    "MacOSAppTracker": "keylogger",
+    "TypingPatternAnalyzer": "analyzer",
+    "KeystrokeEvent": "utils",
+    "ConfigManager": "utils",
+    "DataManager": "utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include the lazily imported names in dir(src)."""
+    return sorted(set(globals()) | set(__all__))
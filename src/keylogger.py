@@ -1,10 +1,15 @@
 # ABOUTME: Core keylogger implementation with macOS accessibility integration and comprehensive data collection
+import queue
+import re
 import time
 import threading
 import signal
 import sys
 import logging
-from typing import Optional, Dict, Any, List
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Deque, List, Mapping, Tuple
 
 # macOS specific imports
 from pynput import keyboard
@@ -31,26 +36,258 @@ except ImportError:
     )
 
 
+# Common typos checked against each completed word
+_COMMON_TYPOS = {
+    'teh': 'the', 'adn': 'and', 'recieve': 'receive',
+    'seperate': 'separate', 'definately': 'definitely',
+    'occured': 'occurred', 'accomodate': 'accommodate'
+}
+# A typo must make up the whole word: it ends the checked window and starts
+# after a non-letter or at the start of the window
+_TYPO_RE = re.compile("(?:^|[^a-z])(%s)$" % "|".join(map(re.escape, _COMMON_TYPOS)))
+_TYPO_WINDOW = max(map(len, _COMMON_TYPOS))
+
+# Shared, read-only result for the common case of a keystroke that is
+# neither a correction nor the end of a likely typo
+_NOOP_CORRECTION: Mapping[str, Any] = MappingProxyType({
+    'is_correction': False,
+    'correction_length': 0,
+    'corrected_text': '',
+    'likely_typo': False,
+    'correction_type': 'none',
+})
+
+
+def _special_key_code(key: Any, index: int) -> int:
+    """Return the key's virtual key code, or a negative id derived from its index."""
+    vk = getattr(key.value, "vk", None)
+    return int(vk) if vk is not None else -(index + 1)
+
+
+# Key codes for special keys: pynput's virtual key code where the platform
+# provides one, otherwise a stable negative id that cannot clash with a vk
+_SPECIAL_KEY_CODES: Dict[Any, int] = {
+    key: _special_key_code(key, i) for i, key in enumerate(keyboard.Key)
+}
+_SPECIAL_KEY_CHARS = {"space": " ", "tab": "\t", "enter": "\n"}
+_CORRECTION_KEYS = frozenset({keyboard.Key.backspace, keyboard.Key.delete})
+
+# Context keywords that scale the cognitive load estimate
+_HIGH_LOAD_CONTEXT_RE = re.compile("code|terminal", re.IGNORECASE)  # Code requires more thinking
+_LOW_LOAD_CONTEXT_RE = re.compile("email|message", re.IGNORECASE)  # Casual writing is easier
+_CONTEXT_CACHE_LIMIT = 1024
+
+# --duration values such as '30m' or '24h'
+_DURATION_RE = re.compile(r"^(\d+)([hms])$")
+_DURATION_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600}
+
+
 class MacOSAppTracker:
     """Track active applications and window context on macOS."""
 
-    def __init__(self):
+    def __init__(self, context_ttl: float = 0.25, observer_fallback_ttl: float = 5.0):
         self.workspace = NSWorkspace.sharedWorkspace()
         self.current_app = ""
         self.current_window = ""
+        # (app name, window title, fetch time) reused for context_ttl seconds,
+        # or observer_fallback_ttl once app activation notifications have
+        # been seen to arrive and keep it current
+        self.context_ttl = context_ttl
+        self.observer_fallback_ttl = observer_fallback_ttl
+        self._ctx_cache: Tuple[str, str, float] = ("", "", 0.0)
+
+        # Notification observer state, owned by the observer thread
+        self._observing = False
+        self._activation_seen = False
+        self._observer_stop = threading.Event()
+        self._observer_thread: Optional[threading.Thread] = None
+        self._workspace_observer: Any = None
+        self._ax_observer: Any = None
+        self._ax_source: Any = None
+        self._ax_app: Any = None
+        self._ax_app_name = ""
+
+    def get_context(self, now: float) -> Tuple[str, str]:
+        """Get the active app name and window title, re-querying at most once per TTL."""
+        app_name, window_title, fetched_at = self._ctx_cache
+        ttl = (
+            self.observer_fallback_ttl
+            if self._observing and self._activation_seen
+            else self.context_ttl
+        )
+        if 0.0 <= now - fetched_at < ttl:
+            return app_name, window_title
+
+        try:
+            active_app = self.workspace.frontmostApplication()
+        except Exception as e:
+            logging.error(f"Error getting active app: {e}")
+            active_app = None
+
+        app_name = self._app_name(active_app)
+        window_title = self._window_title(active_app)
+        self.current_app = app_name
+        self.current_window = window_title
+        self._ctx_cache = (app_name, window_title, now)
+        return app_name, window_title
+
+    def start_observing(self) -> None:
+        """Push app and window changes into the context cache from a background thread.
+
+        Polling in get_context() remains as a slower fallback in case the
+        notifications are not delivered.
+        """
+        if self._observer_thread is not None:
+            return
+
+        self._observer_stop.clear()
+        self._observer_thread = threading.Thread(
+            target=self._observe, name="AppContextObserver", daemon=True
+        )
+        self._observer_thread.start()
+
+    def stop_observing(self) -> None:
+        """Stop the notification observers and fall back to polling."""
+        self._observer_stop.set()
+        if self._workspace_observer is not None:
+            self.workspace.notificationCenter().removeObserver_(self._workspace_observer)
+            self._workspace_observer = None
+        if self._observer_thread is not None:
+            self._observer_thread.join(timeout=2.0)
+            self._observer_thread = None
+
+    def _observe(self) -> None:
+        """Run AXObserver and NSWorkspace notifications on this thread's run loop."""
+        try:
+            from Cocoa import (
+                AXObserverAddNotification,
+                AXObserverCreate,
+                AXObserverGetRunLoopSource,
+                AXUIElementCreateApplication,
+                CFRunLoopAddSource,
+                CFRunLoopGetCurrent,
+                CFRunLoopPerformBlock,
+                CFRunLoopRemoveSource,
+                CFRunLoopRunInMode,
+                CFRunLoopWakeUp,
+                NSOperationQueue,
+                NSWorkspaceApplicationKey,
+                NSWorkspaceDidActivateApplicationNotification,
+                kAXFocusedWindowChangedNotification,
+                kAXTitleChangedNotification,
+                kCFRunLoopDefaultMode,
+                kCFRunLoopRunFinished,
+            )
+        except ImportError as e:
+            logging.warning(f"App change notifications unavailable, polling instead: {e}")
+            return
+
+        run_loop = CFRunLoopGetCurrent()
+
+        def on_window_changed(observer: Any, element: Any, notification: Any, refcon: Any) -> None:
+            # Only update the title while the cache still describes the
+            # observed app; polling may already have moved on to another one.
+            # The fetch time is left alone so polling still revalidates it.
+            app_name, _, fetched_at = self._ctx_cache
+            if app_name != self._ax_app_name:
+                return
+            # Title changes fire for every window of the app, so re-read the
+            # focused window's title rather than trusting the notifying element
+            title = self._window_title(self._ax_app)
+            self.current_window = title
+            self._ctx_cache = (app_name, title, fetched_at)
+
+        def watch_app(active_app: Any) -> None:
+            # Move the AX observer over to the newly active application
+            if self._ax_source is not None:
+                CFRunLoopRemoveSource(run_loop, self._ax_source, kCFRunLoopDefaultMode)
+                self._ax_source = None
+                self._ax_observer = None
+                self._ax_app = None
+                self._ax_app_name = ""
+
+            app_name = self._app_name(active_app)
+            window_title = self._window_title(active_app)
+            self.current_app = app_name
+            self.current_window = window_title
+            self._ctx_cache = (app_name, window_title, time.time())
+            if not active_app:
+                return
+
+            pid = active_app.processIdentifier()
+            error, observer = AXObserverCreate(pid, on_window_changed, None)
+            if error or observer is None:
+                logging.debug(f"Could not observe {app_name} (AX error {error})")
+                return
+
+            app_ref = AXUIElementCreateApplication(pid)
+            for notification in (kAXFocusedWindowChangedNotification, kAXTitleChangedNotification):
+                AXObserverAddNotification(observer, app_ref, notification, None)
+            self._ax_observer = observer
+            self._ax_app = active_app
+            self._ax_app_name = app_name
+            self._ax_source = AXObserverGetRunLoopSource(observer)
+            CFRunLoopAddSource(run_loop, self._ax_source, kCFRunLoopDefaultMode)
+
+        def on_app_activated(notification: Any) -> None:
+            self._activation_seen = True
+            active_app = notification.userInfo()[NSWorkspaceApplicationKey]
+            # AX run loop sources must be swapped on the observer thread
+            CFRunLoopPerformBlock(run_loop, kCFRunLoopDefaultMode, lambda: watch_app(active_app))
+            CFRunLoopWakeUp(run_loop)
+
+        try:
+            # A queue of our own so the block does not depend on the main run
+            # loop, which the CLI never runs; it hands off to this thread
+            self._workspace_observer = (
+                self.workspace.notificationCenter().addObserverForName_object_queue_usingBlock_(
+                    NSWorkspaceDidActivateApplicationNotification,
+                    None,
+                    NSOperationQueue.alloc().init(),
+                    on_app_activated,
+                )
+            )
+            watch_app(self.workspace.frontmostApplication())
+            self._observing = True
+
+            while not self._observer_stop.is_set():
+                if CFRunLoopRunInMode(kCFRunLoopDefaultMode, 1.0, False) == kCFRunLoopRunFinished:
+                    # No sources attached yet; wait for the next activation
+                    time.sleep(1.0)
+        except Exception as e:
+            logging.warning(f"App change notifications failed, polling instead: {e}")
+        finally:
+            self._observing = False
+            self._activation_seen = False
 
     def get_active_app(self) -> str:
         """Get the currently active application name."""
         try:
-            active_app = self.workspace.frontmostApplication()
-            if active_app:
-                return active_app.localizedName() or "Unknown"
+            return self._app_name(self.workspace.frontmostApplication())
         except Exception as e:
             logging.error(f"Error getting active app: {e}")
         return "Unknown"
 
     def get_window_title(self) -> str:
         """Get the current window title using Accessibility API."""
+        try:
+            return self._window_title(self.workspace.frontmostApplication())
+        except Exception as e:
+            logging.debug(f"Could not get window title: {e}")
+            return ""
+
+    @staticmethod
+    def _app_name(active_app: Any) -> str:
+        if active_app:
+            return active_app.localizedName() or "Unknown"
+        return "Unknown"
+
+    @staticmethod
+    def _window_title(active_app: Any) -> str:
+        # The focused window and its title live on different AX elements, so
+        # the two lookups cannot be batched into one attribute request.
+        if not active_app:
+            return ""
         try:
             from Cocoa import (
                 AXUIElementCreateApplication,
@@ -59,12 +296,7 @@ class MacOSAppTracker:
                 kAXTitleAttribute,
             )
 
-            # Get frontmost application
-            app = self.workspace.frontmostApplication()
-            if not app:
-                return ""
-
-            pid = app.processIdentifier()
+            pid = active_app.processIdentifier()
             app_ref = AXUIElementCreateApplication(pid)
 
             # Get focused window
@@ -90,8 +322,14 @@ class TypingAnalyzerKeylogger:
 
     def __init__(self, config_path: Optional[str] = None):
         self.config = ConfigManager(config_path or "config.yaml")
+
+        # Settings read on hot paths, resolved once
+        self._burst_threshold = float(self.config.get("analysis.burst_threshold", 0.15))
+        self._save_interval = float(self.config.get("collection.save_interval_seconds", 60))
+        self._buffer_size = int(self.config.get("collection.buffer_size", 10000))
+
         self.data_manager = DataManager(
-            self.config.get("output.data_directory", "./data")
+            self.config.get("output.data_directory", "./data"), self._buffer_size
         )
         self.app_tracker = MacOSAppTracker()
 
@@ -99,213 +337,241 @@ class TypingAnalyzerKeylogger:
         self.session_id = generate_session_id()
         self.last_keystroke_time = 0.0
         self.is_running = False
-        self.key_press_times: Dict[int, float] = {}
+        self._stop_event = threading.Event()
+        # Pressed key -> (press time, key code, key char, key name), so the
+        # release reuses the key info computed on press
+        self.key_press_times: Dict[Any, Tuple[float, int, str, str]] = {}
+
+        # Released keys are queued by the listener thread and turned into
+        # events on a worker thread, so the listener returns immediately
+        self._keystroke_queue: "queue.Queue[Optional[Tuple[float, int, str, str, float, bool]]]" = queue.Queue()
+        self._keystroke_worker: Optional[threading.Thread] = None
 
         # Statistics
         self.total_keystrokes = 0
         self.session_start_time = time.time()
         
         # Enhanced error tracking
-        self.recent_keystrokes: List[str] = []  # Last 10 keystrokes for context
+        # Recent keystrokes for context: room for the longest typo, the
+        # separator before it and the boundary key that ends the word
+        self.recent_keystrokes: Deque[str] = deque(maxlen=_TYPO_WINDOW + 2)
         self.correction_sequences: List[Dict[str, Any]] = []
         self.last_key_was_correction = False
 
+        # Cognitive load multiplier per (app name, window title)
+        self._ctx_class_cache: Dict[Tuple[str, str], float] = {}
+
         # Setup logging
         setup_logging(self.config.get("output.log_level", "INFO"))
 
         logging.info(f"Initialized typing analyzer with session ID: {self.session_id}")
 
-    def _calculate_cognitive_load(self, pause_duration: float, context: str) -> float:
-        """Calculate cognitive load indicator based on pause patterns."""
-        # Baseline cognitive load calculation
-        base_load = min(pause_duration / 2.0, 1.0)  # Normalize to 0-1
-
-        # Context-specific adjustments
-        if "code" in context.lower() or "terminal" in context.lower():
-            base_load *= 1.2  # Code requires more thinking
-        elif "email" in context.lower() or "message" in context.lower():
-            base_load *= 0.8  # Casual writing is easier
+    def _context_multiplier(self, app_name: str, window_title: str) -> float:
+        """Get the cognitive load multiplier for an app/window context."""
+        key = (app_name, window_title)
+        multiplier = self._ctx_class_cache.get(key)
+        if multiplier is None:
+            context = f"{app_name} {window_title}"
+            if _HIGH_LOAD_CONTEXT_RE.search(context):
+                multiplier = 1.2
+            elif _LOW_LOAD_CONTEXT_RE.search(context):
+                multiplier = 0.8
+            else:
+                multiplier = 1.0
+            if len(self._ctx_class_cache) >= _CONTEXT_CACHE_LIMIT:
+                self._ctx_class_cache.clear()
+            self._ctx_class_cache[key] = multiplier
+        return multiplier
 
-        return min(base_load, 1.0)
+    def _calculate_cognitive_load(self, pause_duration: float, multiplier: float) -> float:
+        """Calculate cognitive load indicator based on pause patterns."""
+        # Baseline cognitive load normalized to 0-1, then scaled by context
+        return min(min(pause_duration / 2.0, 1.0) * multiplier, 1.0)
 
     def _is_correction_key(self, key: Any) -> bool:
         """Check if key is a correction/deletion key."""
-        if hasattr(key, "name"):
-            return key.name in ["backspace", "delete"]
-        return False
+        return key in _CORRECTION_KEYS
     
-    def _detect_correction_sequence(self, key_char: str, key_name: str, is_correction: bool) -> Dict[str, Any]:
+    def _detect_correction_sequence(self, key_char: str, key_name: str, is_correction: bool) -> Mapping[str, Any]:
         """Detect and analyze correction sequences and typo patterns."""
-        correction_data = {
-            'is_correction': is_correction,
-            'correction_length': 0,
-            'corrected_text': '',
-            'likely_typo': False,
-            'correction_type': 'none'
-        }
-        
+        self.last_key_was_correction, was_correction = is_correction, self.last_key_was_correction
+
         if is_correction:
-            # Track correction sequence
-            if not self.last_key_was_correction:
-                # Start of new correction sequence
-                correction_data['correction_type'] = 'single_correction'
-            else:
-                # Continuing correction sequence
-                correction_data['correction_type'] = 'multi_correction'
-                
+            correction_data = {
+                'is_correction': True,
+                'correction_length': 0,
+                'corrected_text': '',
+                'likely_typo': False,
+                # Start of a new correction sequence, or continuing one
+                'correction_type': 'multi_correction' if was_correction else 'single_correction',
+            }
+
             # Estimate what was corrected based on recent keystrokes
             if len(self.recent_keystrokes) > 0:
-                correction_data['corrected_text'] = self.recent_keystrokes[-1] if self.recent_keystrokes else ''
-                correction_data['correction_length'] = 1
-                
                 # Remove from recent keystrokes as it's being corrected
-                self.recent_keystrokes = self.recent_keystrokes[:-1]
-        else:
-            # Regular keystroke
-            if key_char and key_char.isprintable():
-                # Add to recent keystrokes buffer (keep last 10)
-                self.recent_keystrokes.append(key_char)
-                if len(self.recent_keystrokes) > 10:
-                    self.recent_keystrokes.pop(0)
-                
-                # Check for likely typos based on patterns
-                if len(self.recent_keystrokes) >= 2:
-                    # Look for common typo patterns
-                    last_two = ''.join(self.recent_keystrokes[-2:])
-                    
-                    # Common typo patterns
-                    common_typos = {
-                        'teh': 'the', 'adn': 'and', 'recieve': 'receive',
-                        'seperate': 'separate', 'definately': 'definitely',
-                        'occured': 'occurred', 'accomodate': 'accommodate'
+                correction_data['corrected_text'] = self.recent_keystrokes.pop()
+                correction_data['correction_length'] = 1
+            return correction_data
+
+        # Regular keystroke; whitespace control keys (enter, tab) are kept
+        # too so they separate words like any other boundary key
+        if key_char:
+            # Add to recent keystrokes buffer (deque keeps only the typo window)
+            recent = self.recent_keystrokes
+            recent.append(key_char)
+
+            # Typos resolve at the end of a word, so only check the word
+            # just completed when a boundary key is typed
+            if not key_char.isalnum() and len(recent) >= 2:
+                # The longest typo plus the separator before it, excluding
+                # the boundary key just typed
+                word_end = ''.join(
+                    islice(recent, max(0, len(recent) - _TYPO_WINDOW - 2), len(recent) - 1)
+                ).lower()
+                match = _TYPO_RE.search(word_end)
+                if match:
+                    typo = match.group(1)
+                    return {
+                        **_NOOP_CORRECTION,
+                        'likely_typo': True,
+                        'typo_pattern': f"{typo} -> {_COMMON_TYPOS[typo]}",
                     }
-                    
-                    # Check if recent text contains common typos
-                    recent_text = ''.join(self.recent_keystrokes[-6:]).lower()
-                    for typo, correct in common_typos.items():
-                        if typo in recent_text:
-                            correction_data['likely_typo'] = True
-                            correction_data['typo_pattern'] = f"{typo} -> {correct}"
-                            break
-        
-        self.last_key_was_correction = is_correction
-        return correction_data
+
+        return _NOOP_CORRECTION
 
     def _get_key_info(self, key: Any) -> tuple[int, str, str]:
         """Extract key information from pynput key object."""
         try:
-            if hasattr(key, "char") and key.char:
+            vk = getattr(key, "vk", None)
+            char = getattr(key, "char", None)
+            if char:
                 # Regular character key
-                return hash(key.char), key.char, key.char
-            elif hasattr(key, "name"):
-                # Special key
-                key_code = hash(key.name)
+                if vk is None:
+                    vk = ord(char) if len(char) == 1 else hash(char)
+                return vk, char, char
+            elif key in _SPECIAL_KEY_CODES:
+                # Special key, converted to its character representation
+                # where it has one (space, tab, enter)
                 key_name = key.name
-                
-                # Convert special keys to their character representation
-                if key_name == "space":
-                    return key_code, " ", "space"
-                elif key_name == "tab":
-                    return key_code, "\t", "tab"
-                elif key_name == "enter":
-                    return key_code, "\n", "enter"
-                else:
-                    # Other special keys (backspace, delete, etc.)
-                    return key_code, "", key_name
+                return _SPECIAL_KEY_CODES[key], _SPECIAL_KEY_CHARS.get(key_name, ""), key_name
+            elif vk is not None:
+                # Key code without a character (e.g. media keys)
+                return vk, "", str(key)
             else:
                 # Fallback
                 return hash(str(key)), "", str(key)
-        except AttributeError:
+        except (AttributeError, TypeError):
             return hash(str(key)), "", str(key)
 
     def on_key_press(self, key: Any) -> None:
         """Handle key press events with comprehensive data collection."""
         try:
             current_time = time.time()
-            key_code, key_char, key_name = self._get_key_info(key)
-
             # Store press time for dwell calculation
-            self.key_press_times[key_code] = current_time
+            self.key_press_times[key] = (current_time, *self._get_key_info(key))
 
         except Exception as e:
             logging.error(f"Error in key press handler: {e}")
 
     def on_key_release(self, key: Any) -> None:
-        """Handle key release events and create keystroke records."""
+        """Handle key release events by queueing them for the keystroke worker."""
         try:
             current_time = time.time()
-            key_code, key_char, key_name = self._get_key_info(key)
-
-            # Calculate dwell time
-            press_time = self.key_press_times.get(key_code, current_time)
-            dwell_time = current_time - press_time
-
-            # Calculate time since last keystroke
-            time_since_last = (
-                current_time - self.last_keystroke_time
-                if self.last_keystroke_time > 0
-                else 0.0
-            )
+            # Calculate dwell time, cleaning up press time tracking
+            pressed = self.key_press_times.pop(key, None)
+            if pressed is None:
+                pressed = (current_time, *self._get_key_info(key))
+            press_time, key_code, key_char, key_name = pressed
+
+            self._keystroke_queue.put_nowait((
+                current_time,
+                key_code,
+                key_char,
+                key_name,
+                current_time - press_time,
+                self._is_correction_key(key),
+            ))
 
-            # Get application context
-            app_name = self.app_tracker.get_active_app()
-            window_title = self.app_tracker.get_window_title()
+        except Exception as e:
+            logging.error(f"Error in key release handler: {e}")
 
-            # Detect corrections and pauses
-            is_correction = self._is_correction_key(key)
-            pause_before = time_since_last if time_since_last > 0.1 else 0.0
-            
-            # Enhanced correction analysis
-            correction_data = self._detect_correction_sequence(key_char, key_name, is_correction)
+    def _process_keystrokes(self) -> None:
+        """Record queued key releases until the shutdown sentinel arrives."""
+        while True:
+            item = self._keystroke_queue.get()
+            if item is None:
+                return
+            try:
+                self._record_keystroke(*item)
+            except Exception as e:
+                logging.error(f"Error recording keystroke: {e}")
+
+    def _record_keystroke(
+        self,
+        current_time: float,
+        key_code: int,
+        key_char: str,
+        key_name: str,
+        dwell_time: float,
+        is_correction: bool,
+    ) -> None:
+        """Create and store a keystroke record for one key release."""
+        # Calculate time since last keystroke
+        time_since_last = (
+            current_time - self.last_keystroke_time
+            if self.last_keystroke_time > 0
+            else 0.0
+        )
 
-            # Calculate cognitive load
-            cognitive_load = self._calculate_cognitive_load(
-                pause_before, f"{app_name} {window_title}"
-            )
+        # Get application context (cached between AX queries)
+        app_name, window_title = self.app_tracker.get_context(current_time)
 
-            # Create keystroke event
-            event = KeystrokeEvent(
-                timestamp=current_time,
-                key_code=key_code,
-                key_char=key_char,
-                key_name=key_name,
-                dwell_time=dwell_time,
-                time_since_last=time_since_last,
-                app_name=app_name,
-                window_title=window_title,
-                session_id=self.session_id,
-                is_correction=is_correction,
-                pause_before=pause_before,
-                typing_burst=time_since_last
-                < self.config.get("analysis.burst_threshold", 0.15),
-                finger_assignment=get_finger_for_key(key_char or key_name),
-                cognitive_load_indicator=cognitive_load,
-                correction_type=correction_data.get('correction_type'),
-                corrected_text=correction_data.get('corrected_text'),
-                likely_typo=correction_data.get('likely_typo'),
-                typo_pattern=correction_data.get('typo_pattern'),
-            )
+        # Detect pauses
+        pause_before = time_since_last if time_since_last > 0.1 else 0.0
+        
+        # Enhanced correction analysis
+        correction_data = self._detect_correction_sequence(key_char, key_name, is_correction)
 
-            # Store the event
-            self.data_manager.add_keystroke(event)
+        # Calculate cognitive load
+        cognitive_load = self._calculate_cognitive_load(
+            pause_before, self._context_multiplier(app_name, window_title)
+        )
 
-            # Update tracking variables
-            self.last_keystroke_time = current_time
-            self.total_keystrokes += 1
+        # Create keystroke event
+        event = KeystrokeEvent(
+            timestamp=current_time,
+            key_code=key_code,
+            key_char=key_char,
+            key_name=key_name,
+            dwell_time=dwell_time,
+            time_since_last=time_since_last,
+            app_name=app_name,
+            window_title=window_title,
+            session_id=self.session_id,
+            is_correction=is_correction,
+            pause_before=pause_before,
+            typing_burst=time_since_last < self._burst_threshold,
+            finger_assignment=get_finger_for_key(key_char or key_name),
+            cognitive_load_indicator=cognitive_load,
+            correction_type=correction_data.get('correction_type'),
+            corrected_text=correction_data.get('corrected_text'),
+            likely_typo=correction_data.get('likely_typo'),
+            typo_pattern=correction_data.get('typo_pattern'),
+        )
 
-            # Clean up press time tracking
-            if key_code in self.key_press_times:
-                del self.key_press_times[key_code]
+        # Store the event
+        self.data_manager.add_keystroke(event)
 
-            # Log progress periodically
-            if self.total_keystrokes % 1000 == 0:
-                elapsed = current_time - self.session_start_time
-                logging.info(
-                    f"Recorded {self.total_keystrokes} keystrokes in {elapsed:.1f}s"
-                )
+        # Update tracking variables
+        self.last_keystroke_time = current_time
+        self.total_keystrokes += 1
 
-        except Exception as e:
-            logging.error(f"Error in key release handler: {e}")
+        # Log progress periodically
+        if self.total_keystrokes % 1000 == 0:
+            elapsed = current_time - self.session_start_time
+            logging.info(
+                f"Recorded {self.total_keystrokes} keystrokes in {elapsed:.1f}s"
+            )
 
     def start_monitoring(self) -> None:
         """Start the keylogger monitoring."""
@@ -314,7 +580,13 @@ class TypingAnalyzerKeylogger:
             return
 
         self.is_running = True
+        self._stop_event.clear()
         self.session_start_time = time.time()
+        self.app_tracker.start_observing()
+        self._keystroke_worker = threading.Thread(
+            target=self._process_keystrokes, name="KeystrokeWorker", daemon=True
+        )
+        self._keystroke_worker.start()
 
         logging.info("Starting typing pattern monitoring...")
         logging.info("Press Ctrl+C to stop monitoring and save data")
@@ -324,12 +596,10 @@ class TypingAnalyzerKeylogger:
         signal.signal(signal.SIGTERM, self._signal_handler)
 
         # Setup periodic buffer flush
-        flush_timer = threading.Timer(
-            self.config.get("collection.save_interval_seconds", 60),
-            self._periodic_flush,
+        flush_thread = threading.Thread(
+            target=self._flush_loop, name="PeriodicFlush", daemon=True
         )
-        flush_timer.daemon = True
-        flush_timer.start()
+        flush_thread.start()
 
         # Start keyboard monitoring with proper signal handling
         try:
@@ -338,13 +608,12 @@ class TypingAnalyzerKeylogger:
             )
             self.listener.start()
             
-            # Keep main thread alive and responsive to signals
-            while self.is_running:
-                try:
-                    time.sleep(0.1)
-                except KeyboardInterrupt:
-                    logging.info("Keyboard interrupt received")
-                    break
+            # Block the main thread until stopped; signal handlers still run
+            # while it waits
+            try:
+                self._stop_event.wait()
+            except KeyboardInterrupt:
+                logging.info("Keyboard interrupt received")
             
             self.listener.stop()
             
@@ -355,35 +624,36 @@ class TypingAnalyzerKeylogger:
             logging.error(f"Error starting keyboard listener: {e}")
             self.stop_monitoring()
 
-    def _periodic_flush(self) -> None:
-        """Periodically flush data buffer."""
-        if self.is_running:
+    def _flush_loop(self) -> None:
+        """Periodically flush data buffer until monitoring stops."""
+        while not self._stop_event.wait(self._save_interval):
             self.data_manager.flush_buffer()
-            # Schedule next flush
-            flush_timer = threading.Timer(
-                self.config.get("collection.save_interval_seconds", 60),
-                self._periodic_flush,
-            )
-            flush_timer.daemon = True
-            flush_timer.start()
 
     def _signal_handler(self, signum: int, frame: Any) -> None:
         """Handle shutdown signals gracefully."""
         logging.info(f"Received signal {signum}, shutting down...")
-        self.is_running = False
+        # stop_monitoring() owns shutdown: it drains the keystroke queue and
+        # closes the data manager, and returns early if is_running is cleared
         if hasattr(self, 'listener'):
             self.listener.stop()
         self.stop_monitoring()
 
     def stop_monitoring(self) -> None:
         """Stop monitoring and save remaining data."""
+        self._stop_event.set()
         if not self.is_running:
             return
 
         self.is_running = False
+        self.app_tracker.stop_observing()
 
-        # Flush remaining data
-        self.data_manager.flush_buffer()
+        # Record keystrokes still queued, then flush remaining data and stop
+        # the writer thread
+        if self._keystroke_worker is not None:
+            self._keystroke_queue.put(None)
+            self._keystroke_worker.join()
+            self._keystroke_worker = None
+        self.data_manager.close()
 
         # Log session summary
         elapsed = time.time() - self.session_start_time
@@ -444,23 +714,12 @@ def main():
 
 def parse_duration(duration_str: str) -> float:
     """Parse duration string like '1h', '30m', '24h' into seconds."""
-    import re
-
-    match = re.match(r"^(\d+)([hms])$", duration_str.lower())
+    match = _DURATION_RE.match(duration_str.lower())
     if not match:
         raise ValueError(f"Invalid duration format: {duration_str}")
 
     value, unit = match.groups()
-    value = int(value)
-
-    if unit == "s":
-        return value
-    elif unit == "m":
-        return value * 60
-    elif unit == "h":
-        return value * 3600
-    else:
-        raise ValueError(f"Invalid duration unit: {unit}")
+    return int(value) * _DURATION_UNIT_SECONDS[unit]
 
 
 if __name__ == "__main__":
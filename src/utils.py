@@ -1,15 +1,40 @@
 # ABOUTME: Shared utilities for typing pattern analyzer
+import atexit
+import importlib.util
 import json
+import queue
+import sys
+import threading
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Sequence, Tuple, Union, cast
+from dataclasses import dataclass, fields
 from pathlib import Path
+import numpy as np
 import yaml
 import logging
+import logging.handlers
 
+# Faster JSON encoding for keystroke data files when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@dataclass
+# Columnar Arrow data files when pyarrow is available; pyarrow itself is
+# imported on first use
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+# Slotted dataclasses need Python 3.10+; older versions fall back to __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class KeystrokeEvent:
     """Comprehensive keystroke event data structure."""
 
@@ -34,13 +59,98 @@ class KeystrokeEvent:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            "timestamp": self.timestamp,
+            "key_code": self.key_code,
+            "key_char": self.key_char,
+            "key_name": self.key_name,
+            "dwell_time": self.dwell_time,
+            "time_since_last": self.time_since_last,
+            "app_name": self.app_name,
+            "window_title": self.window_title,
+            "session_id": self.session_id,
+            "is_correction": self.is_correction,
+            "pause_before": self.pause_before,
+            "typing_burst": self.typing_burst,
+            "finger_assignment": self.finger_assignment,
+            "cognitive_load_indicator": self.cognitive_load_indicator,
+            "correction_type": self.correction_type,
+            "corrected_text": self.corrected_text,
+            "likely_typo": self.likely_typo,
+            "typo_pattern": self.typo_pattern,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "KeystrokeEvent":
         """Create from dictionary."""
         return cls(**data)
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """Convert to a tuple of field values in declaration order."""
+        return (
+            self.timestamp,
+            self.key_code,
+            self.key_char,
+            self.key_name,
+            self.dwell_time,
+            self.time_since_last,
+            self.app_name,
+            self.window_title,
+            self.session_id,
+            self.is_correction,
+            self.pause_before,
+            self.typing_burst,
+            self.finger_assignment,
+            self.cognitive_load_indicator,
+            self.correction_type,
+            self.corrected_text,
+            self.likely_typo,
+            self.typo_pattern,
+        )
+
+    @classmethod
+    def from_tuple(cls, values: Sequence[Any]) -> "KeystrokeEvent":
+        """Create from field values in declaration order."""
+        return cls(*values)
+
+
+_EVENT_FIELDS = tuple(field.name for field in fields(KeystrokeEvent))
+
+# Arrow schema mirroring KeystrokeEvent, in field order (built on first use)
+_ARROW_SCHEMA: Optional["pa.Schema"] = None
+
+
+def _arrow_schema() -> "pa.Schema":
+    """Get the keystroke Arrow schema, importing pyarrow on first use."""
+    global _ARROW_SCHEMA
+    if _ARROW_SCHEMA is not None:
+        return _ARROW_SCHEMA
+
+    import pyarrow as pa
+
+    schema = pa.schema([
+        ("timestamp", pa.float64()),
+        ("key_code", pa.int64()),
+        ("key_char", pa.string()),
+        ("key_name", pa.string()),
+        ("dwell_time", pa.float64()),
+        ("time_since_last", pa.float64()),
+        ("app_name", pa.string()),
+        ("window_title", pa.string()),
+        ("session_id", pa.string()),
+        ("is_correction", pa.bool_()),
+        ("pause_before", pa.float64()),
+        ("typing_burst", pa.bool_()),
+        ("finger_assignment", pa.string()),
+        ("cognitive_load_indicator", pa.float64()),
+        ("correction_type", pa.string()),
+        ("corrected_text", pa.string()),
+        ("likely_typo", pa.bool_()),
+        ("typo_pattern", pa.string()),
+    ])
+    _ARROW_SCHEMA = schema
+    return schema
+
 
 # Standard QWERTY finger mapping for analysis
 FINGER_MAP = {
@@ -99,6 +209,13 @@ FINGER_MAP = {
     "backspace": "right_pinky",
 }
 
+# FINGER_MAP plus upper-case single characters, so typed keys resolve
+# without allocating a lower-cased copy
+_FINGER_MAP_CI = {
+    **FINGER_MAP,
+    **{k.upper(): v for k, v in FINGER_MAP.items() if len(k) == 1},
+}
+
 
 class ConfigManager:
     """Configuration management with validation."""
@@ -157,32 +274,111 @@ class ConfigManager:
 class DataManager:
     """Efficient data storage and retrieval."""
 
-    def __init__(self, data_dir: Union[str, Path] = "./data"):
+    def __init__(self, data_dir: Union[str, Path] = "./data", buffer_size: int = 10000):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        self._buffer: List[KeystrokeEvent] = []
-        self._buffer_size = 10000
+        # Preallocated slots filled up to _head and reused after every hand-off
+        self._buffer_size = buffer_size
+        self._buffer: List[Optional[KeystrokeEvent]] = [None] * self._buffer_size
+        self._head = 0
+
+        # Full buffers are handed to a writer thread (started on first use)
+        # so callers never block on disk IO
+        self._lock = threading.Lock()
+        self._write_queue: "queue.Queue[Optional[List[KeystrokeEvent]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
 
     def add_keystroke(self, event: KeystrokeEvent) -> None:
-        """Add keystroke to buffer."""
-        self._buffer.append(event)
-        if len(self._buffer) >= self._buffer_size:
-            self.flush_buffer()
+        """Add keystroke to buffer, handing it to the writer thread when full."""
+        with self._lock:
+            self._buffer[self._head] = event
+            self._head += 1
+            if self._head >= self._buffer_size:
+                self._hand_off()
 
     def flush_buffer(self) -> None:
-        """Save buffer to disk."""
-        if not self._buffer:
+        """Save buffer to disk, waiting until every pending batch is written."""
+        with self._lock:
+            self._hand_off()
+        self._write_queue.join()
+
+    def close(self) -> None:
+        """Flush remaining data and stop the writer thread."""
+        self.flush_buffer()
+        if self._writer is None:
             return
+        self._write_queue.put(None)
+        self._writer.join()
+        self._writer = None
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = self.data_dir / f"keystrokes_{timestamp}.json"
+    def _hand_off(self) -> None:
+        """Queue the current buffer for writing and start a new one (lock held)."""
+        if not self._head:
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="DataManagerWriter", daemon=True
+            )
+            self._writer.start()
+        head = self._head
+        # Every slot below _head holds an event
+        batch = cast(List[KeystrokeEvent], self._buffer[:head])
+        self._write_queue.put(batch)
+        # Drop the buffer's references so written events can be freed
+        self._buffer[:head] = [None] * head
+        self._head = 0
+
+    def _writer_loop(self) -> None:
+        """Write queued batches until the shutdown sentinel arrives."""
+        # Resolve the output format once, on the writer thread, so pyarrow is
+        # only imported once there is data to write
+        use_arrow = HAS_PYARROW
+        if use_arrow:
+            try:
+                import pyarrow.ipc  # noqa: F401
+                _arrow_schema()
+            except ImportError as e:
+                logging.warning(f"pyarrow unavailable, saving keystrokes as JSON: {e}")
+                use_arrow = False
+
+        while True:
+            batch = self._write_queue.get()
+            try:
+                if batch is None:
+                    return
+                self._write_batch(batch, use_arrow)
+            except Exception as e:
+                logging.error(f"Error saving keystrokes: {e}")
+            finally:
+                self._write_queue.task_done()
+
+    def _write_batch(self, batch: List[KeystrokeEvent], use_arrow: bool) -> None:
+        """Serialize one batch of keystrokes to a new Arrow IPC or JSON data file."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        if use_arrow:
+            import pyarrow as pa
+            import pyarrow.ipc
+
+            schema = _arrow_schema()
+            filename = self.data_dir / f"keystrokes_{timestamp}.arrow"
+            # Transpose the batch's rows into one column per schema field
+            columns = dict(zip(_EVENT_FIELDS, zip(*map(KeystrokeEvent.to_tuple, batch))))
+            record_batch = pa.RecordBatch.from_pydict(columns, schema=schema)
+            with pa.OSFile(str(filename), "wb") as sink:
+                with pyarrow.ipc.new_stream(sink, schema) as writer:
+                    writer.write_batch(record_batch)
+            logging.info(f"Saved {len(batch)} keystrokes to {filename}")
+            return
 
-        data = [event.to_dict() for event in self._buffer]
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=2)
+        filename = self.data_dir / f"keystrokes_{timestamp}.json"
+        data = [event.to_dict() for event in batch]
+        if HAS_ORJSON:
+            filename.write_bytes(orjson.dumps(data))
+        else:
+            with open(filename, "w") as f:
+                json.dump(data, f)
 
-        logging.info(f"Saved {len(self._buffer)} keystrokes to {filename}")
-        self._buffer.clear()
+        logging.info(f"Saved {len(batch)} keystrokes to {filename}")
 
     def load_data(
         self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
@@ -200,8 +396,84 @@ class DataManager:
             except (json.JSONDecodeError, KeyError) as e:
                 logging.error(f"Error loading {file_path}: {e}")
 
+        if HAS_PYARROW:
+            import pyarrow as pa
+
+            for file_path in self._arrow_files():
+                try:
+                    events.extend(self._load_arrow(file_path, start_date, end_date))
+                except (pa.ArrowException, OSError) as e:
+                    logging.error(f"Error loading {file_path}: {e}")
+
         return sorted(events, key=lambda x: x.timestamp)
 
+    def load_arrays(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> Dict[str, np.ndarray]:
+        """Load keystroke data within date range as one NumPy array per event field.
+
+        Arrow-only data directories are read column by column without
+        building KeystrokeEvent objects; JSON data goes through load_data().
+        """
+        if HAS_PYARROW and not any(self.data_dir.glob("keystrokes_*.json")):
+            import pyarrow as pa
+
+            tables = []
+            for file_path in self._arrow_files():
+                try:
+                    tables.append(self._read_arrow(file_path, start_date, end_date))
+                except (pa.ArrowException, OSError) as e:
+                    logging.error(f"Error loading {file_path}: {e}")
+            table = pa.concat_tables(tables) if tables else _arrow_schema().empty_table()
+            table = table.sort_by("timestamp")
+            return {
+                name: table.column(name).to_numpy(zero_copy_only=False)
+                for name in _EVENT_FIELDS
+            }
+
+        events = self.load_data(start_date, end_date)
+        return {
+            name: np.array([getattr(event, name) for event in events])
+            for name in _EVENT_FIELDS
+        }
+
+    def _arrow_files(self) -> List[Path]:
+        """Arrow IPC data files plus Parquet files written by earlier versions."""
+        return [
+            *self.data_dir.glob("keystrokes_*.arrow"),
+            *self.data_dir.glob("keystrokes_*.parquet"),
+        ]
+
+    def _read_arrow(
+        self, file_path: Path, start: Optional[datetime], end: Optional[datetime]
+    ) -> "pa.Table":
+        """Read one Arrow or Parquet data file, filtering the date range on the timestamp column."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.ipc
+        import pyarrow.parquet as pq
+
+        if file_path.suffix == ".parquet":
+            table = pq.read_table(file_path, schema=_arrow_schema())
+        else:
+            with pa.memory_map(str(file_path)) as source:
+                table = pyarrow.ipc.open_stream(source).read_all()
+        if start:
+            table = table.filter(pc.greater_equal(table["timestamp"], start.timestamp()))
+        if end:
+            table = table.filter(pc.less_equal(table["timestamp"], end.timestamp()))
+        return table
+
+    def _load_arrow(
+        self, file_path: Path, start: Optional[datetime], end: Optional[datetime]
+    ) -> List[KeystrokeEvent]:
+        """Load one Arrow or Parquet data file as keystroke events."""
+        columns = self._read_arrow(file_path, start, end).to_pydict()
+        return list(map(
+            KeystrokeEvent.from_tuple,
+            zip(*(columns[name] for name in _EVENT_FIELDS)),
+        ))
+
     def _in_date_range(
         self, timestamp: float, start: Optional[datetime], end: Optional[datetime]
     ) -> bool:
@@ -215,12 +487,34 @@ class DataManager:
 
 
 def setup_logging(level: str = "INFO") -> None:
-    """Configure logging for the application."""
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler("typing_analyzer.log"), logging.StreamHandler()],
-    )
+    """Configure logging for the application.
+
+    Records are queued by the calling thread and written to the log file and
+    console by a background QueueListener, so logging never blocks on IO.
+    """
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers: List[logging.Handler] = [
+        logging.FileHandler("typing_analyzer.log"),
+        logging.StreamHandler(),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # The listener's handlers apply the full format; only merge args here
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logging.basicConfig(level=getattr(logging, level.upper()), handlers=[queue_handler])
+    if queue_handler not in logging.getLogger().handlers:
+        # Logging was already configured
+        for handler in handlers:
+            handler.close()
+        return
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def generate_session_id() -> str:
@@ -230,18 +524,32 @@ def generate_session_id() -> str:
 
 def get_finger_for_key(key: str) -> str:
     """Get finger assignment for a key."""
-    return FINGER_MAP.get(key.lower(), "unknown")
+    finger = _FINGER_MAP_CI.get(key)
+    if finger is None:
+        finger = FINGER_MAP.get(key.lower(), "unknown")
+    return finger
+
 
+def calculate_wpm(
+    keystrokes: Union[List[KeystrokeEvent], np.ndarray], duration_seconds: float
+) -> float:
+    """Calculate words per minute from keystroke data.
 
-def calculate_wpm(keystrokes: List[KeystrokeEvent], duration_seconds: float) -> float:
-    """Calculate words per minute from keystroke data."""
+    Accepts keystroke events or a key_char array from DataManager.load_arrays().
+    """
     if duration_seconds <= 0:
         return 0.0
 
     # Count characters (excluding special keys)
-    char_count = sum(
-        1 for k in keystrokes if len(k.key_char) == 1 and k.key_char.isalnum()
-    )
+    if isinstance(keystrokes, np.ndarray):
+        key_chars = keystrokes.astype(str)
+        char_count = int(
+            np.count_nonzero((np.char.str_len(key_chars) == 1) & np.char.isalnum(key_chars))
+        )
+    else:
+        char_count = sum(
+            1 for k in keystrokes if len(k.key_char) == 1 and k.key_char.isalnum()
+        )
 
     # Standard WPM calculation (5 characters = 1 word)
     words = char_count / 5
@@ -251,9 +559,19 @@ def calculate_wpm(keystrokes: List[KeystrokeEvent], duration_seconds: float) ->
 
 
 def detect_typing_burst(
-    events: List[KeystrokeEvent], threshold: float = 0.15
-) -> List[KeystrokeEvent]:
-    """Mark events that are part of typing bursts."""
+    events: Union[List[KeystrokeEvent], np.ndarray], threshold: float = 0.15
+) -> Union[List[KeystrokeEvent], np.ndarray]:
+    """Mark events that are part of typing bursts.
+
+    Given a time_since_last array from DataManager.load_arrays(), returns the
+    burst flags as a boolean array instead of updating events.
+    """
+    if isinstance(events, np.ndarray):
+        bursts = events < threshold
+        if bursts.size:
+            bursts[0] = False
+        return bursts
+
     for i, event in enumerate(events):
         if i > 0 and event.time_since_last < threshold:
             event.typing_burst = True
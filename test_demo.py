@@ -1,11 +1,46 @@
 # ABOUTME: Safe demonstration script for typing analyzer testing
-from src.analyzer import TypingPatternAnalyzer
 from src.utils import KeystrokeEvent
+import hashlib
+import heapq
+import itertools
+import statistics
 import time
-import random
+from operator import itemgetter
+from pathlib import Path
 
-def create_realistic_sample_data(num_keystrokes=500):
-    """Create realistic sample typing data for testing."""
+import numpy as np
+
+# Generated sample data is cached as Parquet when pyarrow is available
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+DEMO_CACHE_DIR = Path(".demo_cache")
+# Cached sample data is keyed by this file's contents, so any change to the
+# generator invalidates it
+GENERATOR_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:12]
+DEMO_SEED = 42
+BACKSPACE_CODE = 8
+
+# Cognitive load range for each demo context (TextEdit, Terminal, PyCharm,
+# Slack, Chrome)
+CL_RANGES = np.array([(0.2, 0.4), (0.4, 0.7), (0.3, 0.6), (0.1, 0.3), (0.2, 0.5)])
+
+# Simple home-row finger mapping for demo keys (lowercase)
+_FINGER_MAP = {
+    'a': 'left_pinky', 's': 'left_ring', 'd': 'left_middle', 'f': 'left_index',
+    'j': 'right_index', 'k': 'right_middle', 'l': 'right_ring', ';': 'right_pinky',
+    ' ': 'thumbs', 'backspace': 'right_pinky'
+}
+
+def create_sample_columns(num_keystrokes=500, seed=None, base_time=None):
+    """Create realistic sample typing data as one NumPy array per event field.
+    
+    Timestamps start from base_time, which defaults to now.
+    """
     
     # Common English text patterns
     common_words = [
@@ -23,105 +58,125 @@ def create_realistic_sample_data(num_keystrokes=500):
         ("Chrome", "GitHub - typing-analyzer")
     ]
     
-    events = []
-    base_time = time.time()
+    if base_time is None:
+        base_time = time.time()
     session_id = "demo-session"
+    n = num_keystrokes
+    rng = np.random.default_rng(seed)
+    
+    # Character stream cycling through the words, space-separated
+    text = np.array(list(" ".join(common_words) + " "), dtype="U1")
+    text_pos = np.arange(n) % len(text)
+    chars = text[text_pos]
+    is_space = chars == " "
+    # A word starts at the first keystroke and after every space
+    word_start = np.empty(n, dtype=bool)
+    word_start[:1] = True
+    word_start[1:] = is_space[:-1]
+    key_names = np.where(is_space, "space", chars)
+    
+    # Realistic timing variations: longer pauses at word boundaries,
+    # slight hesitation at word start, normal rhythm otherwise
+    time_deltas = np.where(
+        is_space,
+        rng.uniform(0.2, 0.4, n),
+        np.where(word_start, rng.uniform(0.15, 0.25, n), rng.uniform(0.08, 0.18, n)),
+    )
+    timestamps = base_time + np.cumsum(time_deltas)
+    
+    # Occasional corrections (backspace), 5% correction rate
+    corr_mask = rng.random(n) < 0.05
+    time_deltas = np.where(corr_mask, rng.uniform(0.1, 0.3, n), time_deltas)
+    
+    # Calculate metrics
+    pause_before = np.where(time_deltas > 0.1, time_deltas, 0.0)
+    typing_burst = time_deltas < 0.15
+    dwell_times = rng.uniform(0.06, 0.12, n)
+    
+    # Switch context every 100 keystrokes
+    context_ids = (np.arange(n) // 100 + 1) % len(contexts)
+    
+    # Cognitive load varies by context; one draw per keystroke from its range
+    lo, hi = CL_RANGES[context_ids].T
+    cognitive_loads = rng.uniform(lo, hi)
+    
+    # Corrections replace the typed character with a backspace
+    key_chars = np.where(corr_mask, "", chars)
+    key_names = np.where(corr_mask, "backspace", key_names)
+    
+    # Key codes are the characters' code points (read straight from the U1
+    # buffer), with the ASCII backspace code for corrections
+    key_codes = np.where(corr_mask, BACKSPACE_CODE, chars.view(np.uint32)).astype(np.int64)
+    
+    # Fingers only depend on the key, so map each character of the text once
+    text_fingers = np.array([get_demo_finger(key) for key in text.tolist()])
+    fingers = np.where(corr_mask, get_demo_finger("backspace"), text_fingers[text_pos])
+    
+    app_names, window_titles = np.array(contexts).T
+    
+    # Columns in KeystrokeEvent field order
+    return {
+        "timestamp": timestamps,
+        "key_code": key_codes,
+        "key_char": key_chars,
+        "key_name": key_names,
+        "dwell_time": dwell_times,
+        "time_since_last": time_deltas,
+        "app_name": app_names[context_ids],
+        "window_title": window_titles[context_ids],
+        "session_id": np.full(n, session_id),
+        "is_correction": corr_mask,
+        "pause_before": pause_before,
+        "typing_burst": typing_burst,
+        "finger_assignment": fingers,
+        "cognitive_load_indicator": cognitive_loads,
+    }
+
+def create_realistic_sample_data(num_keystrokes=500, seed=None):
+    """Create realistic sample typing data for testing.
+    
+    Seeded data is deterministic, so it is cached to a Parquet file keyed by
+    (num_keystrokes, seed, generator version) and reloaded on later runs.
+    Cached timestamps are relative and re-based on the current time.
+    """
+    if seed is None or not HAS_PYARROW:
+        columns = create_sample_columns(num_keystrokes, seed)
+        return list(itertools.starmap(
+            KeystrokeEvent, zip(*(column.tolist() for column in columns.values()))
+        ))
+    
+    cache_path = (
+        DEMO_CACHE_DIR / f"events_{num_keystrokes}_{seed}_{GENERATOR_VERSION}.parquet"
+    )
+    if cache_path.exists():
+        table = pq.read_table(cache_path)
+    else:
+        table = pa.table(create_sample_columns(num_keystrokes, seed, base_time=0.0))
+        DEMO_CACHE_DIR.mkdir(exist_ok=True)
+        pq.write_table(table, cache_path, compression="zstd")
+    
+    columns = table.to_pydict()
+    base_time = time.time()
+    columns["timestamp"] = [base_time + offset for offset in columns["timestamp"]]
     
-    current_time = base_time
-    word_idx = 0
-    context_idx = 0
-    
-    for i in range(num_keystrokes):
-        # Switch context occasionally
-        if i % 100 == 0:
-            context_idx = (context_idx + 1) % len(contexts)
-        
-        app_name, window_title = contexts[context_idx]
-        
-        # Get next character from word sequence
-        current_word = common_words[word_idx % len(common_words)]
-        char_in_word = i % len(current_word)
-        
-        if char_in_word == 0 and i > 0:
-            # Add space between words
-            key_char = " "
-            key_name = "space"
-        else:
-            key_char = current_word[char_in_word]
-            key_name = key_char
-            
-        if char_in_word == len(current_word) - 1:
-            word_idx += 1
-        
-        # Realistic timing variations
-        if key_char == " ":
-            # Longer pauses at word boundaries
-            time_delta = random.uniform(0.2, 0.4)
-        elif char_in_word == 0:
-            # Slight hesitation at word start
-            time_delta = random.uniform(0.15, 0.25)
-        else:
-            # Normal typing rhythm
-            time_delta = random.uniform(0.08, 0.18)
-        
-        current_time += time_delta
-        
-        # Occasional corrections (backspace)
-        is_correction = random.random() < 0.05  # 5% correction rate
-        if is_correction:
-            key_char = ""
-            key_name = "backspace"
-            time_delta = random.uniform(0.1, 0.3)
-        
-        # Calculate metrics
-        pause_before = time_delta if time_delta > 0.1 else 0.0
-        typing_burst = time_delta < 0.15
-        
-        # Cognitive load varies by context
-        cognitive_load = {
-            "TextEdit": random.uniform(0.2, 0.4),
-            "Terminal": random.uniform(0.4, 0.7),
-            "PyCharm": random.uniform(0.3, 0.6),
-            "Slack": random.uniform(0.1, 0.3),
-            "Chrome": random.uniform(0.2, 0.5)
-        }[app_name]
-        
-        # Create event
-        event = KeystrokeEvent(
-            timestamp=current_time,
-            key_code=hash(key_char or key_name),
-            key_char=key_char,
-            key_name=key_name,
-            dwell_time=random.uniform(0.06, 0.12),
-            time_since_last=time_delta,
-            app_name=app_name,
-            window_title=window_title,
-            session_id=session_id,
-            is_correction=is_correction,
-            pause_before=pause_before,
-            typing_burst=typing_burst,
-            finger_assignment=get_demo_finger(key_char or key_name),
-            cognitive_load_indicator=cognitive_load
-        )
-        
-        events.append(event)
-    
-    return events
+    # Columns are in KeystrokeEvent field order, so rows map to positional args
+    return list(itertools.starmap(KeystrokeEvent, zip(*columns.values())))
 
 def get_demo_finger(key):
     """Simple finger mapping for demo."""
-    finger_map = {
-        'a': 'left_pinky', 's': 'left_ring', 'd': 'left_middle', 'f': 'left_index',
-        'j': 'right_index', 'k': 'right_middle', 'l': 'right_ring', ';': 'right_pinky',
-        ' ': 'thumbs', 'backspace': 'right_pinky'
-    }
-    return finger_map.get(key.lower(), 'right_index')
+    return _FINGER_MAP.get(key.lower(), 'right_index')
 
-def run_demo_analysis():
-    """Run a complete demonstration of the typing analyzer."""
+def run_demo_analysis(html_report=False):
+    """Run a complete demonstration of the typing analyzer.
+    
+    Reports are written as Parquet (JSON without pyarrow); pass
+    html_report=True to also render the HTML report.
+    """
+    # Imported here so the data helpers can be used without loading the analyzer
+    from src.analyzer import TypingPatternAnalyzer
     
     print("🔍 Creating realistic sample typing data...")
-    sample_events = create_realistic_sample_data(500)
+    sample_events = create_realistic_sample_data(500, seed=DEMO_SEED)
     print(f"✅ Generated {len(sample_events)} sample keystrokes")
     
     print("\n📊 Initializing analyzer...")
@@ -143,7 +198,7 @@ def run_demo_analysis():
     
     print(f"\n🖐️ FINGER USAGE:")
     finger_usage = results['finger_usage']['finger_usage_percentages']
-    for finger, percentage in sorted(finger_usage.items(), key=lambda x: x[1], reverse=True)[:5]:
+    for finger, percentage in heapq.nlargest(5, finger_usage.items(), key=itemgetter(1)):
         print(f"  {finger.replace('_', ' ').title()}: {percentage:.1f}%")
     
     print(f"\n🧠 COGNITIVE LOAD:")
@@ -158,17 +213,20 @@ def run_demo_analysis():
     flow_periods = results['efficiency_metrics']['flow_state_periods']
     print(f"  Flow periods detected: {len(flow_periods)}")
     if flow_periods:
-        avg_flow_wpm = sum(p['wpm'] for p in flow_periods) / len(flow_periods)
+        avg_flow_wpm = statistics.fmean(p['wpm'] for p in flow_periods)
         print(f"  Average flow WPM: {avg_flow_wpm:.1f}")
     
     print(f"\n📱 APP-SPECIFIC PERFORMANCE:")
     app_wpm = results['efficiency_metrics']['app_specific_wpm']
-    for app, wpm in sorted(app_wpm.items(), key=lambda x: x[1], reverse=True):
+    for app, wpm in sorted(app_wpm.items(), key=itemgetter(1), reverse=True):
         print(f"  {app}: {wpm:.1f} WPM")
     
     # Generate reports
     print(f"\n📄 Generating reports...")
-    generated_files = analyzer.generate_reports(['json', 'html'])
+    report_formats = ['parquet'] if HAS_PYARROW else ['json']
+    if html_report:
+        report_formats.append('html')
+    generated_files = analyzer.generate_reports(report_formats)
     
     print(f"\n📋 Reports generated:")
     for format_type, filepath in generated_files.items():
@@ -180,4 +238,8 @@ def run_demo_analysis():
     return results
 
 if __name__ == "__main__":
-    run_demo_analysis()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Typing analyzer demo")
+    parser.add_argument("--html", action="store_true", help="Also generate the HTML report")
+    run_demo_analysis(html_report=parser.parse_args().html)
\ No newline at end of file
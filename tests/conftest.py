@@ -0,0 +1,7 @@
+# ABOUTME: Shared pytest configuration for typing pattern analyzer tests
+
+
+def pytest_configure(config):
+    """Register custom markers (pytest.ini's [tool:pytest] section is not read by pytest)."""
+    config.addinivalue_line("markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')")
+    config.addinivalue_line("markers", "integration: marks tests as integration tests")
@@ -1,42 +1,64 @@
 # ABOUTME: Unit tests for typing pattern analysis functionality
+import functools
+import numpy as np
 import pytest
 import tempfile
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
+from typing import Tuple
 
 from src.analyzer import TypingPatternAnalyzer
 from src.utils import KeystrokeEvent, DataManager
 
+@functools.lru_cache(maxsize=4)
+def _build_sample_events(count: int) -> Tuple[KeystrokeEvent, ...]:
+    """Build deterministic sample events, cached as an immutable tuple."""
+    base_time = 1234567890.0
+    idx = np.arange(count)
+    timestamps = base_time + idx * 0.2
+    key_codes = 65 + idx % 26
+    chars = np.array(list('abcdefghijklmnopqrstuvwxyz'))[idx % 26]
+    corr_mask = idx % 10 == 9  # Every 10th keystroke is correction
+    pauses = np.where(idx % 5 == 0, 0.1, 0.05)  # Varying pauses
+    bursts = idx % 3 != 0  # Most are burst typing
+    fingers = np.where(np.isin(chars, list('qaz')), 'left_pinky', 'right_index')
+    cognitive_loads = 0.3 + (idx % 10) * 0.07  # Varying cognitive load
+    return tuple(
+        KeystrokeEvent(
+            timestamp=t,
+            key_code=kc,
+            key_char=ch,
+            key_name=ch,
+            dwell_time=0.1,
+            time_since_last=0.2 if i > 0 else 0.0,
+            app_name='TextEdit' if i < 50 else 'Terminal',
+            window_title='Document.txt' if i < 50 else 'Terminal Window',
+            session_id='test-session',
+            is_correction=corr,
+            pause_before=pause,
+            typing_burst=burst,
+            finger_assignment=finger,
+            cognitive_load_indicator=cl
+        )
+        for i, t, kc, ch, corr, pause, burst, finger, cl in zip(
+            range(count), timestamps.tolist(), key_codes.tolist(), chars.tolist(),
+            corr_mask.tolist(), pauses.tolist(), bursts.tolist(), fingers.tolist(),
+            cognitive_loads.tolist(),
+        )
+    )
+
 class TestTypingPatternAnalyzer:
     """Test typing pattern analysis functionality."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_events(self):
         """Create sample keystroke events for testing."""
-        base_time = 1234567890.0
-        return [
-            KeystrokeEvent(
-                timestamp=base_time + i * 0.2,
-                key_code=65 + (i % 26),
-                key_char=chr(65 + (i % 26)).lower(),
-                key_name=chr(65 + (i % 26)).lower(),
-                dwell_time=0.1,
-                time_since_last=0.2 if i > 0 else 0.0,
-                app_name='TextEdit' if i < 50 else 'Terminal',
-                window_title='Document.txt' if i < 50 else 'Terminal Window',
-                session_id='test-session',
-                is_correction=(i % 10 == 9),  # Every 10th keystroke is correction
-                pause_before=0.1 if i % 5 == 0 else 0.05,  # Varying pauses
-                typing_burst=(i % 3 != 0),  # Most are burst typing
-                finger_assignment='left_pinky' if chr(65 + (i % 26)).lower() in 'qaz' else 'right_index',
-                cognitive_load_indicator=0.3 + (i % 10) * 0.07  # Varying cognitive load
-            )
-            for i in range(100)
-        ]
+        return list(_build_sample_events(100))
     
-    @pytest.fixture
-    def analyzer_with_data(self, sample_events):
-        """Create analyzer with sample data."""
+    @pytest.fixture(scope="module")
+    def analyzer_base(self, sample_events):
+        """Create analyzer with sample data, shared by every test in the module."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Create temporary config
             config_content = f"""
@@ -57,6 +79,14 @@ analysis:
             
             yield analyzer
     
+    @pytest.fixture
+    def analyzer_with_data(self, analyzer_base):
+        """Shared analyzer with its events restored after each test."""
+        events = analyzer_base.events
+        yield analyzer_base
+        analyzer_base.events = events
+        analyzer_base.analysis_results = {}
+    
     def test_key_usage_analysis(self, analyzer_with_data):
         """Test key usage pattern analysis."""
         results = analyzer_with_data.analyze_key_usage()
@@ -143,6 +173,7 @@ analysis:
         # Should have app-specific data
         assert len(results['app_cognitive_load']) > 0
     
+    @pytest.mark.slow
     def test_flow_state_detection(self, analyzer_with_data):
         """Test flow state detection."""
         # Create events with sustained fast typing
@@ -180,6 +211,7 @@ analysis:
         assert 'wpm' in flow
         assert flow['keystroke_count'] >= 50
     
+    @pytest.mark.slow
     def test_full_analysis(self, analyzer_with_data):
         """Test comprehensive analysis."""
         results = analyzer_with_data.run_full_analysis()
@@ -204,6 +236,7 @@ analysis:
         # Should have timestamp
         assert 'analysis_timestamp' in results['metadata']
     
+    @pytest.mark.slow
     def test_report_generation(self, analyzer_with_data):
         """Test report generation in different formats."""
         # Run analysis first
@@ -222,6 +255,45 @@ analysis:
             assert Path(file_path).exists()
             assert Path(file_path).stat().st_size > 0
     
+    def test_parquet_report_generation(self, analyzer_with_data):
+        """Test tabular analysis sections are written as Parquet files."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        analyzer_with_data.run_full_analysis()
+        
+        generated_files = analyzer_with_data.generate_reports(['parquet'])
+        report_dir = Path(generated_files['parquet'])
+        
+        finger_usage = pq.read_table(report_dir / 'finger_usage.parquet').to_pydict()
+        assert sum(finger_usage['count']) == 100
+        app_wpm = pq.read_table(report_dir / 'app_wpm.parquet')
+        assert app_wpm.column_names == ['app_name', 'wpm']
+        assert (report_dir / 'flow_periods.parquet').exists()
+    
+    def test_html_report_escapes_user_text(self, analyzer_with_data):
+        """Test captured text is HTML-escaped in the report."""
+        # Replace rather than mutate the events shared with other tests
+        analyzer_with_data.events = [
+            replace(event, app_name='<b>App</b>') for event in analyzer_with_data.events
+        ]
+        analyzer_with_data.run_full_analysis()
+
+        generated_files = analyzer_with_data.generate_reports(['html'])
+        content = Path(generated_files['html']).read_text()
+
+        assert '&lt;b&gt;App&lt;/b&gt;' in content
+        assert '<b>App</b>' not in content
+
+    def test_analysis_results_cached_until_events_change(self, analyzer_with_data):
+        """Test repeated analysis calls reuse results for unchanged events."""
+        first = analyzer_with_data.analyze_key_usage()
+        assert analyzer_with_data.analyze_key_usage() is first
+
+        # Replacing the events invalidates the cached result
+        analyzer_with_data.events = analyzer_with_data.events[:50]
+        refreshed = analyzer_with_data.analyze_key_usage()
+        assert refreshed is not first
+        assert refreshed['total_keystrokes'] == 50
+
     def test_empty_data_handling(self):
         """Test handling of empty dataset."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -0,0 +1,77 @@
+# ABOUTME: Unit tests for keylogger typo detection and shutdown
+import signal
+import threading
+
+import pytest
+
+# The keylogger needs the macOS input and workspace APIs; pynput raises a
+# plain ImportError when no supported input backend is available
+try:
+    from src.keylogger import TypingAnalyzerKeylogger, _COMMON_TYPOS
+    from src.utils import DataManager
+except ImportError as e:
+    pytest.skip(f"keylogger dependencies unavailable: {e}", allow_module_level=True)
+
+@pytest.fixture
+def keylogger(tmp_path):
+    """Create keylogger writing to a temporary data directory."""
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(f"output:\n  data_directory: {tmp_path}/data\n")
+    return TypingAnalyzerKeylogger(str(config_path))
+
+class TestTypoDetection:
+    """Test typo detection on completed words."""
+
+    def type_text(self, keylogger, text):
+        """Feed text through correction detection, returning the last result."""
+        result = None
+        for char in text:
+            result = keylogger._detect_correction_sequence(char, char, False)
+        return result
+
+    def test_longest_typo_detected(self, keylogger):
+        """Test the longest common typo fits in the recent keystroke window."""
+        typo = max(_COMMON_TYPOS, key=len)
+        result = self.type_text(keylogger, f"I {typo} ")
+
+        assert result['likely_typo'] is True
+        assert result['typo_pattern'] == f"{typo} -> {_COMMON_TYPOS[typo]}"
+
+    def test_word_ending_in_typo_not_detected(self, keylogger):
+        """Test a typo inside a longer word is not reported."""
+        result = self.type_text(keylogger, "steh ")
+
+        assert not result['likely_typo']
+        assert 'typo_pattern' not in result
+
+    def test_typo_ended_by_enter_detected(self, keylogger):
+        """Test enter ends a word like any other boundary key."""
+        result = self.type_text(keylogger, "teh\n")
+
+        assert result['likely_typo'] is True
+        assert result['typo_pattern'] == "teh -> the"
+
+    def test_typo_after_enter_detected(self, keylogger):
+        """Test enter separates the typo from the word typed before it."""
+        result = self.type_text(keylogger, "ok\nteh ")
+
+        assert result['likely_typo'] is True
+        assert result['typo_pattern'] == "teh -> the"
+
+class TestShutdown:
+    """Test shutdown saves captured keystrokes."""
+
+    def test_signal_handler_saves_queued_keystrokes(self, keylogger, tmp_path):
+        """Test a shutdown signal drains the keystroke queue and writes the data."""
+        keylogger.is_running = True
+        keylogger._keystroke_worker = threading.Thread(target=keylogger._process_keystrokes)
+        keylogger._keystroke_worker.start()
+        keylogger._keystroke_queue.put((1234567890.0, 65, 'a', 'a', 0.1, False))
+
+        with pytest.raises(SystemExit):
+            keylogger._signal_handler(signal.SIGINT, None)
+
+        assert not keylogger.is_running
+        assert keylogger._keystroke_worker is None
+        events = DataManager(tmp_path / 'data').load_data()
+        assert [event.key_char for event in events] == ['a']
@@ -3,6 +3,7 @@ import pytest
 import tempfile
 import json
 from datetime import datetime
+import numpy as np
 from pathlib import Path
 
 from src.utils import (
@@ -61,6 +62,28 @@ class TestKeystrokeEvent:
         assert restored.key_char == original.key_char
         assert restored.finger_assignment == original.finger_assignment
 
+    def test_keystroke_event_tuple_round_trip(self):
+        """Test event conversion to/from a field-ordered tuple."""
+        original = KeystrokeEvent(
+            timestamp=1234567890.123,
+            key_code=65,
+            key_char='a',
+            key_name='a',
+            dwell_time=0.1,
+            time_since_last=0.2,
+            app_name='TextEdit',
+            window_title='Document.txt',
+            session_id='test-session',
+            is_correction=False,
+            pause_before=0.05,
+            typing_burst=True,
+            finger_assignment='left_pinky'
+        )
+        
+        values = original.to_tuple()
+        assert values == tuple(original.to_dict().values())
+        assert KeystrokeEvent.from_tuple(values) == original
+
 class TestConfigManager:
     """Test configuration management."""
     
@@ -155,7 +178,31 @@ class TestDataManager:
                 data_manager.add_keystroke(event)
             
             # Buffer should have been flushed automatically
-            assert len(data_manager._buffer) == 2  # 5 - 3 (flushed)
+            assert data_manager._head == 2  # 5 - 3 (flushed)
+            assert data_manager._buffer[2] is None  # Handed-off slots are cleared
+
+    def test_close_writes_pending_events(self):
+        """Test closing saves buffered events and stops the writer thread."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_manager = DataManager(temp_dir)
+            data_manager.add_keystroke(KeystrokeEvent(
+                timestamp=1234567890.0,
+                key_code=65,
+                key_char='A',
+                key_name='A',
+                dwell_time=0.1,
+                time_since_last=0.2,
+                app_name='TestApp',
+                window_title='Test Window',
+                session_id='test-session',
+                is_correction=False,
+                pause_before=0.05,
+                typing_burst=True
+            ))
+            data_manager.close()
+
+            assert data_manager._writer is None
+            assert len(data_manager.load_data()) == 1
 
 class TestUtilityFunctions:
     """Test utility functions."""
@@ -254,5 +301,13 @@ class TestUtilityFunctions:
         # Third event should not be burst (0.5s > 0.15s threshold)
         assert processed_events[2].typing_burst is False
 
+    def test_array_inputs(self):
+        """Test WPM and burst detection on load_arrays() columns."""
+        key_chars = np.array(['a'] * 25 + ['', 'shift', ' '])
+        assert calculate_wpm(key_chars, 60.0) == 5.0
+
+        bursts = detect_typing_burst(np.array([0.05, 0.1, 0.5]), threshold=0.15)
+        assert bursts.tolist() == [False, True, False]
+
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file